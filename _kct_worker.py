@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+_kct_worker.py — long-lived pcbnew helper for build_outputs.py --pcbnew-worker
+==============================================================================
+
+Run with KiCad's own Python (the one that can `import pcbnew`):
+
+    python _kct_worker.py <board.kicad_pcb>
+
+The board is loaded once. The worker then answers one JSON line on stdout per
+JSON request line read from stdin:
+
+    -> {"op": "drill", "args": {"out_dir": "..."}}
+    <- {"ok": true}
+
+The first line it prints is {"ok": true} once the board is loaded (or ok=false
+with an "error" if pcbnew/the board could not be loaded). Any failure, including
+unknown ops, is answered with {"ok": false, "error": "..."} so the caller can fall
+back to kicad-cli. Each op reproduces the kicad-cli command build_outputs.py
+would run, including kicad-cli's defaults for options it doesn't pass:
+
+- drill    {out_dir}  `pcb export drill --format excellon --generate-map`: mm, decimal
+                      zeros, absolute origin, no mirror, full header, PTH/NPTH merged,
+                      oval holes in alternate (G85) format, PDF drill map
+- pos      {out}      `pcb export pos --format csv --units mm --side both`: all
+                      footprints (not SMD-only, TH and DNP kept), absolute origin,
+                      bottom X not negated
+
+The output has not been diffed against kicad-cli on every KiCad release, which is
+why the worker is opt-in; compare a run with and without --pcbnew-worker when
+upgrading KiCad. STEP/GLB and renders are not exposed by the pcbnew Python API
+and stay on kicad-cli. Gerbers stay on kicad-cli too: --board-plot-params trims the
+saved layer selection to the enabled copper layers and plots in stackup order,
+and a mismatch there gives a wrong layer set without any error to fall back on.
+"""
+
+import json
+import os
+import sys
+
+
+def export_drill(pcbnew, board, out_dir):
+    drl = pcbnew.EXCELLON_WRITER(board)
+    drl.SetFormat(True)  # metric, decimal
+    # mirror, minimal header, offset (absolute origin), merge PTH/NPTH
+    drl.SetOptions(False, False, pcbnew.VECTOR2I(0, 0), True)
+    # EXCELLON_WRITER routes oval holes by default; kicad-cli defaults to alternate (G85)
+    drl.SetRouteModeForOvalHoles(False)
+    drl.SetMapFileFormat(pcbnew.PLOT_FORMAT_PDF)
+    drl.CreateDrillandMapFilesSet(out_dir, True, True)
+
+
+def export_pos(pcbnew, board, out):
+    # units mm, all footprints (not only SMD, keep TH and DNP), both sides, CSV,
+    # absolute origin, bottom X not negated
+    try:
+        exporter = pcbnew.PLACE_FILE_EXPORTER(board, True, False, False, False,
+                                              True, True, True, False, False)
+    except TypeError:
+        # Builds whose constructor also takes aExcludeBOM (after aExcludeDNP)
+        exporter = pcbnew.PLACE_FILE_EXPORTER(board, True, False, False, False, False,
+                                              True, True, True, False, False)
+    with open(out, "w", encoding="utf-8", newline="") as f:
+        f.write(exporter.GenPositionData())
+
+
+OPS = {
+    "drill": lambda pcbnew, board, args: export_drill(pcbnew, board, args["out_dir"]),
+    "pos": lambda pcbnew, board, args: export_pos(pcbnew, board, args["out"]),
+}
+
+
+def reply(out, **msg):
+    out.write(json.dumps(msg) + "\n")
+    out.flush()
+
+
+def main():
+    # pcbnew (including its C++/wx code) may print to fd 1; keep a private copy of
+    # it for the protocol and point fd 1 at stderr before pcbnew is imported
+    out = os.fdopen(os.dup(1), "w")
+    os.dup2(2, 1)
+    sys.stdout = sys.stderr
+    try:
+        import pcbnew
+        board = pcbnew.LoadBoard(sys.argv[1])
+    except Exception as e:
+        reply(out, ok=False, error=f"{type(e).__name__}: {e}")
+        return 1
+    reply(out, ok=True)
+
+    for line in sys.stdin:
+        if not line.strip():
+            continue
+        try:
+            req = json.loads(line)
+            OPS[req["op"]](pcbnew, board, req.get("args", {}))
+        except Exception as e:
+            reply(out, ok=False, error=f"{type(e).__name__}: {e}")
+        else:
+            reply(out, ok=True)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -42,6 +42,7 @@ Requirements
 - KiCad 9 with `kicad-cli` available.
   *Windows default path tried:* C:\\Program Files\\KiCad\\9.0\\bin\\kicad-cli.exe
 - (Optional) KiKit on PATH if you want vendor ZIPs via `--kikit jlcpcb`, etc.
+- (Optional) `pip install isal` for faster (ISA-L) DEFLATE when zipping gerbers.
 
 Key behavior and notes
 ----------------------
@@ -52,6 +53,14 @@ Key behavior and notes
 - Board prints PDF is multi-page across common layers; tweak the layer list in code.
 - README generation happens **only if README.md does not exist**. It auto-picks
   <project>_iso.png as header if present, otherwise <project>_top.png.
+- Exports are skipped when their output is newer than the board/schematic (Make-style
+  mtime check); use --force to rebuild anyway, e.g. after changing export options here.
+  3D exports and renders also count packages3D/ as input and rerun when their command
+  line changes (camera, flags) or the last run exited non-zero (e.g. missing models).
+- Documentation outputs are skipped when the schematic/board (and kicad-cli version)
+  hash the same as on the last run; see DOCUMENTATION/.cache.json.
+- kicad-cli and project file lookups are cached in <root>/.kct_cache.pkl, keyed on the
+  .kicad_pro and script mtimes; the lookup is redone if the cached kicad-cli is gone.
 - The production run goes to a timestamped folder, e.g. PRODUCTION/20250115_1342_<project>/
 
 Usage (PowerShell / CMD on Windows)
@@ -79,9 +88,18 @@ Command-line options
 --prod-dir  Production folder (relative to --root). Default: PRODUCTION
 --iso       Also render an isometric PNG
 --glb       Also export a GLB 3D model
---zip       Create a ZIP of the gerbers
+--zip       Create a ZIP of the gerbers (fast DEFLATE, level 1)
+--zip-store Like --zip, but store the gerbers uncompressed
+--zip-only  Like --zip, but plot gerbers to scratch space (/dev/shm on Linux) and keep
+            only the ZIP, no gerbers/ folder (combine with --zip-store if wanted)
 --kikit     Run 'kikit fab <vendor>' into the production run folder (e.g., 'jlcpcb')
 --skip-drc  Skip generating the DRC report
+--no-timestamp  Write to PRODUCTION/<project> (cleared each run) instead of a timestamped folder
+--pcbnew-worker  Export drill/POS from one persistent KiCad Python process
+            (_kct_worker.py, loads the board once); falls back to kicad-cli on failure
+--force     Re-export everything, even outputs that look up to date
+--verbose   Echo each kicad-cli/KiKit command and show its progress output
+            (hidden by default; a failing command and its errors are always shown)
 
 Troubleshooting
 ---------------
@@ -99,17 +117,34 @@ Troubleshooting
 """
 
 import argparse
-import subprocess
+import asyncio
+import hashlib
+import json
+import mmap
+import os
+import pickle
+import shlex
 import sys
 import shutil
+import tempfile
+import time
 from pathlib import Path
 from datetime import datetime
 import zipfile
+import zlib
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
 from string import Template
 from pathlib import Path
 import shutil
 import re
 
+try:
+    # Optional: ISA-L's SIMD DEFLATE is several times faster than zlib (pip install isal)
+    from isal import isal_zlib as deflate_backend
+except ImportError:
+    deflate_backend = zlib
+
 def clear_dir(path: Path):
     """
     Remove all contents of `path` but keep the directory itself.
@@ -218,8 +253,6 @@ def render_readme_if_missing(root: Path, project_name: str) -> Path:
 # ---------- Helpers ----------
 
 def which_kicad_cli():
-    # Prefer environment override
-    env = Path(str(Path.cwd()))
     exe = shutil.which("kicad-cli")
     if exe:
         return exe
@@ -252,93 +285,493 @@ def find_kicad_python_from_kicad_cli(kicad_cli_path: str) -> str:
         return py
     raise FileNotFoundError("Could not locate a Python interpreter to run KiKit.")
 
-def run(cmd, cwd=None, ok_codes={0}):
-    print(">>", " ".join(map(str, cmd)))
-    res = subprocess.run(cmd, cwd=cwd, capture_output=True, text=True)
-    if res.returncode not in ok_codes:
-        print(res.stdout)
-        print(res.stderr, file=sys.stderr)
-        raise RuntimeError(f"Command failed with code {res.returncode}")
-    return res
+# Caps how many kicad-cli processes run at once; created lazily inside the running loop
+_slots = None
+# Set from --verbose: echo each command and let it write its progress output to our console
+VERBOSE = False
+# Set from --force: rebuild outputs even when they look up to date
+FORCE = False
+
+def spawn_kwargs():
+    """
+    Popen settings shared by every child. The environment is inherited (no env=),
+    so it isn't re-encoded for every spawn. On POSIX our pipes are already
+    non-inheritable (PEP 446), so close_fds=False is safe and lets subprocess
+    use posix_spawn. On Windows close_fds=True is kept: children then inherit
+    only their own std handles, not the pipes of siblings started concurrently.
+    """
+    return {"close_fds": os.name == "nt"}
+
+async def run(cmd, cwd=None, ok_codes={0}):
+    """
+    Run one external command (all arguments must already be str).
+    Raises RuntimeError if the exit code is not in `ok_codes`.
+    """
+    global _slots
+    if _slots is None:
+        _slots = asyncio.Semaphore(os.cpu_count() or 1)
+    async with _slots:
+        if VERBOSE:
+            print(">>", shlex.join(cmd))
+        # stdout is discarded (or inherited with --verbose); only stderr is kept for errors
+        proc = await asyncio.create_subprocess_exec(
+            *cmd, cwd=cwd,
+            stdout=None if VERBOSE else asyncio.subprocess.DEVNULL,
+            stderr=asyncio.subprocess.PIPE,
+            **spawn_kwargs(),
+        )
+        _, err = await proc.communicate()
+    if proc.returncode not in ok_codes:
+        if not VERBOSE:
+            print(">>", shlex.join(cmd), file=sys.stderr)
+        print(err.decode(errors="replace"), file=sys.stderr)
+        raise RuntimeError(f"Command failed with code {proc.returncode}")
+    return proc.returncode
+
+WORKER_SCRIPT = Path(__file__).with_name("_kct_worker.py")
+
+class PcbnewWorker:
+    """
+    Persistent KiCad-Python process (_kct_worker.py) that loads the board once and
+    serves drill/pos exports over JSON lines, instead of one kicad-cli process
+    (and board load) per export. Requests are serialized; a failed request
+    returns False so the caller can fall back to kicad-cli. Once the worker has
+    exited or its pipes broke, every later request fails straight away.
+    """
+    def __init__(self, proc):
+        self.proc = proc
+        self.lock = asyncio.Lock()
+        self.dead = False
+
+    @classmethod
+    async def start(cls, kicad, pcb_path: Path):
+        """Returns a ready worker, or None (with a warning) if pcbnew can't load the board."""
+        python = find_kicad_python_from_kicad_cli(kicad)
+        proc = await asyncio.create_subprocess_exec(
+            python, str(WORKER_SCRIPT), str(pcb_path),
+            stdin=asyncio.subprocess.PIPE, stdout=asyncio.subprocess.PIPE,
+            stderr=None if VERBOSE else asyncio.subprocess.DEVNULL,
+            **spawn_kwargs(),
+        )
+        worker = cls(proc)
+        ready = await worker._read()
+        if not ready.get("ok"):
+            print(f"Warning: pcbnew worker unavailable ({ready.get('error')}); using kicad-cli")
+            await worker.close()
+            return None
+        return worker
+
+    async def _read(self) -> dict:
+        line = await self.proc.stdout.readline()
+        if not line:
+            return {"ok": False, "error": "worker exited"}
+        try:
+            return json.loads(line)
+        except ValueError:
+            # Stray output on the protocol channel: later replies can't be matched up
+            self.dead = True
+            return {"ok": False, "error": line.decode(errors="replace").strip()}
+
+    async def send(self, op: str, **args) -> bool:
+        async with self.lock:
+            if self.dead:
+                return False
+            if VERBOSE:
+                print(">> [pcbnew worker]", op, args)
+            try:
+                self.proc.stdin.write((json.dumps({"op": op, "args": args}) + "\n").encode())
+                await self.proc.stdin.drain()
+                reply = await self._read()
+            except (OSError, ConnectionError) as e:
+                reply = {"ok": False, "error": f"worker exited ({e})"}
+            if self.proc.stdout.at_eof() or self.proc.returncode is not None:
+                self.dead = True
+        if not reply.get("ok"):
+            print(f"Warning: pcbnew worker '{op}' failed ({reply.get('error')}); using kicad-cli")
+        return bool(reply.get("ok"))
+
+    async def close(self):
+        if self.proc.returncode is None:
+            self.proc.stdin.close()
+            await self.proc.wait()
+
+async def kicad_version(kicad) -> str:
+    proc = await asyncio.create_subprocess_exec(
+        str(kicad), "version", stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.DEVNULL,
+        **spawn_kwargs())
+    out, _ = await proc.communicate()
+    return out.decode(errors="replace").strip()
+
+def file_hash(path: Path) -> str:
+    """
+    blake2b of a file without reading it into a bytes object first: boards can be
+    tens of MB. Uses hashlib.file_digest on Python 3.11+, else hashes an mmap.
+    """
+    new = lambda: hashlib.blake2b(digest_size=16)
+    with open(path, "rb") as f:
+        if hasattr(hashlib, "file_digest"):
+            return hashlib.file_digest(f, new).hexdigest()
+        h = new()
+        if os.fstat(f.fileno()).st_size:  # mmap refuses empty files
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as m:
+                h.update(m)
+        return h.hexdigest()
+
+class OutputCache:
+    """
+    Remembers what each output in `out_dir` was built from, in <out_dir>/.cache.json,
+    so unchanged outputs can be skipped. A stamp is any JSON-able value (input
+    hashes, tool version, command line); the output is fresh when it exists and
+    its stored stamp is equal.
+    """
+    def __init__(self, out_dir: Path):
+        self.path = out_dir / ".cache.json"
+        try:
+            self.entries = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            self.entries = {}
+
+    def fresh(self, out: Path, stamp) -> bool:
+        return out.exists() and self.entries.get(out.name) == stamp
+
+    def record(self, out: Path, stamp):
+        self.entries[out.name] = stamp
+
+    def save(self):
+        # Write-then-rename so an interrupted run never leaves a torn cache file
+        tmp = self.path.with_name(self.path.name + ".tmp")
+        tmp.write_text(json.dumps(self.entries, indent=1), encoding="utf-8")
+        os.replace(tmp, self.path)
+
+async def run_cached(cache: OutputCache, out: Path, inputs: dict, cmd, ok_codes={0}):
+    """
+    run(cmd) unless `out` was already built by the same command from the same
+    inputs (`inputs` maps name -> content hash).
+    """
+    stamp = [list(cmd), inputs]
+    if not FORCE and cache.fresh(out, stamp):
+        print(f"== {out.name} is up to date, skipping")
+        return 0
+    code = await run(cmd, ok_codes=ok_codes)
+    cache.record(out, stamp)
+    return code
+
+def up_to_date(out: Path, *inputs: Path) -> bool:
+    """Make-style check: `out` exists and is at least as new as every input."""
+    try:
+        built = os.stat(out).st_mtime_ns
+    except FileNotFoundError:
+        return False
+    return all(os.stat(i).st_mtime_ns <= built for i in inputs)
+
+async def run_if_stale(out: Path, inputs, cmd, ok_codes={0}, worker=None, op=None, op_args=None, cache=None):
+    """
+    run(cmd) unless `out` is newer than all `inputs` (or --force was given).
+    For commands that write a folder, `out` is one file known to be in it.
+    With a PcbnewWorker, `op` (with `op_args`) is tried there first and `cmd` is the fallback.
+    With an OutputCache, `out` must also have been built by the same command line, and
+    only a clean exit (code 0) is recorded, so an accepted partial result is redone.
+    """
+    stamp = list(cmd)
+    if not FORCE and up_to_date(out, *inputs) and (cache is None or cache.fresh(out, stamp)):
+        print(f"== {out.name} is up to date, skipping")
+        return 0
+    if worker and await worker.send(op, **op_args):
+        return 0
+    code = await run(cmd, ok_codes=ok_codes)
+    if cache is not None and code == 0:
+        cache.record(out, stamp)
+    return code
+
+def schematic_sources(sch_path: Path):
+    # Hierarchical sheets live next to the root sheet
+    return sorted(sch_path.parent.glob("*.kicad_sch"))
+
+def model_sources(pcb_path: Path):
+    # 3D models bundled with the project; STEP/GLB and renders embed them
+    models = pcb_path.parent / "packages3D"
+    return sorted(p for p in models.rglob("*") if p.is_file()) if models.is_dir() else []
+
+# Directories already created this run, so repeat calls skip the mkdir syscalls
+_ENSURED = set()
 
 def ensure_dir(p: Path):
-    p.mkdir(parents=True, exist_ok=True)
+    if p not in _ENSURED:
+        p.mkdir(parents=True, exist_ok=True)
+        _ENSURED.add(p)
     return p
 
 def timestamp_tag():
     return datetime.now().strftime("%Y%m%d_%H%M")
 
+PROJECT_SUFFIXES = (".kicad_pro", ".kicad_sch", ".kicad_pcb")
+
+def project_base(project_file: Path) -> str:
+    """The project path without any .kicad_pro/.kicad_sch/.kicad_pcb suffix."""
+    base = str(project_file)
+    for suffix in PROJECT_SUFFIXES:
+        if base.lower().endswith(suffix):
+            return base[:-len(suffix)]  # same base name
+    # user passed the stem without extension; keep dots in it (e.g. "board.v2")
+    return base
+
 def project_paths(project_file: Path):
     """
-    Accepts a .kicad_pro, base name, or path stem.
+    Accepts a .kicad_pro/.kicad_sch/.kicad_pcb, base name, or path stem.
     Returns (proj_stem, sch_path, pcb_path).
     """
-    if project_file.suffix.lower() == ".kicad_pro":
-        stem = project_file.with_suffix("")  # same base name
-        sch = stem.with_suffix(".kicad_sch")
-        pcb = stem.with_suffix(".kicad_pcb")
+    base = project_base(project_file)
+    sch = Path(base + ".kicad_sch")
+    pcb = Path(base + ".kicad_pcb")
+    for path, what in ((sch, "Schematic"), (pcb, "Board")):
+        try:
+            os.stat(path)
+        except FileNotFoundError:
+            raise FileNotFoundError(f"{what} not found: {path}") from None
+    return os.path.basename(base), sch, pcb
+
+# Stored members up to this size are read in one go and added with writestr()
+ZIP_SMALL_MEMBER = 1 << 20
+# Below this many input bytes, compressing in-process beats starting worker processes
+ZIP_PARALLEL_MIN = 8 << 20
+
+def _compress_member(path: str):
+    """
+    Raw-DEFLATE one file (level 1, no zlib header) for a ZIP member, using ISA-L
+    when installed. Module-level so it can run in a worker process.
+    Returns (data, crc, size).
+    """
+    with open(path, "rb") as f:
+        raw = f.read()
+    co = deflate_backend.compressobj(1, deflate_backend.DEFLATED, -15)
+    return co.compress(raw) + co.flush(), deflate_backend.crc32(raw), len(raw)
+
+def _write_raw_member(zf: zipfile.ZipFile, zinfo: zipfile.ZipInfo, data: bytes = None,
+                      src=None):
+    """
+    Append a member whose payload is ready as-is: compressed `data`, or the bytes
+    of the open file `src` for a STORED member. zipfile has no public API for this,
+    so mirror what ZipFile.open(mode="w") does around the payload write.
+    CRC, file_size and compress_type must already be set on `zinfo`.
+    """
+    zinfo.compress_size = zinfo.file_size if data is None else len(data)
+    zinfo.header_offset = zf.fp.tell()
+    zf._writecheck(zinfo)
+    zf._didModify = True
+    zf.fp.write(zinfo.FileHeader())
+    if data is None:
+        _copy_file_into(src, zf.fp, zinfo.file_size)
     else:
-        # if user passed without extension, try both
-        stem = project_file
-        sch = stem.with_suffix(".kicad_sch")
-        pcb = stem.with_suffix(".kicad_pcb")
-    if not sch.exists():
-        raise FileNotFoundError(f"Schematic not found: {sch}")
-    if not pcb.exists():
-        raise FileNotFoundError(f"Board not found: {pcb}")
-    return stem.name, sch, pcb
-
-def zip_dir(src_dir: Path, zip_path: Path):
-    with zipfile.ZipFile(zip_path, "w", compression=zipfile.ZIP_DEFLATED) as zf:
-        for p in src_dir.rglob("*"):
-            zf.write(p, arcname=p.relative_to(src_dir))
+        zf.fp.write(data)
+    zf.start_dir = zf.fp.tell()
+    zf.filelist.append(zinfo)
+    zf.NameToInfo[zinfo.filename] = zinfo
+
+def _copy_file_into(src, dst, size: int):
+    """
+    Append `size` bytes of `src` to the buffered file `dst`. On Linux the kernel
+    copies with os.sendfile; elsewhere (or if it refuses) use 1 MiB chunks.
+    """
+    sent = 0
+    if sys.platform.startswith("linux"):
+        dst.flush()
+        try:
+            while sent < size:
+                n = os.sendfile(dst.fileno(), src.fileno(), sent, size - sent)
+                if n == 0:
+                    break
+                sent += n
+        except OSError:
+            pass
+        # sendfile moved the fd offset behind the buffered writer's back; resync
+        dst.seek(0, os.SEEK_END)
+    if sent < size:
+        src.seek(sent)
+        shutil.copyfileobj(src, dst, 1 << 20)
+
+def _file_crc(f, size: int) -> int:
+    # CRC32 over an mmap so large members aren't read into a bytes object
+    if not size:
+        return 0
+    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as m:
+        return zlib.crc32(m)
+
+CACHE_NAME = ".kct_cache.pkl"
+
+def resolve_project(project: Path, root: Path):
+    """
+    Returns (kicad, proj_stem, sch_path, pcb_path) for `project`.
+    The answer is cached in <root>/.kct_cache.pkl and reused while both the
+    .kicad_pro and this script keep their mtimes and the cached kicad-cli still
+    exists, skipping the PATH scan and file checks on repeated runs.
+    """
+    # Absolute, so cached paths stay valid when run from another directory
+    project = Path(os.path.abspath(project))
+    project_file = Path(project_base(project) + ".kicad_pro")
+    try:
+        stamp = (project_file.stat().st_mtime_ns, Path(__file__).stat().st_mtime_ns)
+    except FileNotFoundError:
+        # No .kicad_pro next to the sources: nothing to key the cache on
+        return (which_kicad_cli(), *project_paths(project))
+
+    cache_path = root / CACHE_NAME
+    key = str(project_file)
+    try:
+        with open(cache_path, "rb") as f:
+            cache = pickle.load(f)
+    except Exception:
+        cache = {}
+
+    hit = cache.get(key)
+    # A moved/uninstalled kicad-cli doesn't touch either mtime; re-resolve then
+    if hit and hit[0] == stamp and os.path.exists(hit[1][0]):
+        return hit[1]
+
+    resolved = (which_kicad_cli(), *project_paths(project))
+    cache[key] = (stamp, resolved)
+    try:
+        with open(cache_path, "wb") as f:
+            pickle.dump(cache, f, protocol=5)
+    except OSError as e:
+        print(f"Warning: couldn't write {cache_path}: {e}")
+    return resolved
+
+def _scan_files(src_dir: Path):
+    """
+    List (arcname, path, stat) for every file under `src_dir`, sorted by arcname.
+    Walks with os.scandir so entry types come from the directory listing and
+    each file is stat'ed once; arcnames use '/' like ZIP expects.
+    """
+    files = []
+    pending = [("", str(src_dir))]
+    while pending:
+        prefix, folder = pending.pop()
+        with os.scandir(folder) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    pending.append((prefix + entry.name + "/", entry.path))
+                elif entry.is_file():
+                    files.append((prefix + entry.name, entry.path, entry.stat()))
+    return sorted(files)
+
+def zip_dir(src_dir: Path, zip_path: Path, store: bool = False, consume: bool = False):
+    """
+    Zip every file under `src_dir`. Uses fast DEFLATE (level 1) by default, which
+    compresses gerbers nearly as well as the default level; `store` skips compression.
+    Members are compressed independently, across worker processes for large trees,
+    and written by a single writer in sorted order.
+    With `consume`, each file is deleted as soon as it is in the archive.
+    """
+    compression = zipfile.ZIP_STORED if store else zipfile.ZIP_DEFLATED
+    files = _scan_files(src_dir)
+
+    deflated = {}
+    if not store:
+        paths = [path for _, path, _ in files]
+        if len(paths) > 1 and sum(st.st_size for _, _, st in files) >= ZIP_PARALLEL_MIN:
+            # zip_dir runs in a thread; forking a multi-threaded process can deadlock
+            with ProcessPoolExecutor(mp_context=multiprocessing.get_context("spawn")) as pool:
+                deflated = dict(zip(paths, pool.map(_compress_member, paths)))
+        else:
+            deflated = {path: _compress_member(path) for path in paths}
+
+    with zipfile.ZipFile(zip_path, "w", compression=compression, compresslevel=1) as zf:
+        for arcname, path, st in files:
+            zinfo = zipfile.ZipInfo(arcname, date_time=time.localtime(st.st_mtime)[:6])
+            zinfo.external_attr = (st.st_mode & 0xFFFF) << 16
+            zinfo.compress_type = compression
+            zinfo.file_size = st.st_size
+            if path in deflated:
+                data, zinfo.CRC, zinfo.file_size = deflated[path]
+                _write_raw_member(zf, zinfo, data)
+            elif st.st_size <= ZIP_SMALL_MEMBER:
+                with open(path, "rb") as f:
+                    zf.writestr(zinfo, f.read())
+            else:
+                with open(path, "rb") as src:
+                    zinfo.CRC = _file_crc(src, st.st_size)
+                    _write_raw_member(zf, zinfo, src=src)
+            if consume:
+                os.unlink(path)
 
 # ---------- Export steps ----------
+# Every kicad-cli invocation is an independent process reading the same board or
+# schematic, so each export step launches its commands together and awaits them all.
+# Output folders are created once up front by main().
 
-def export_3d(kicad, pcb_path: Path, out_dir: Path, make_glb: bool):
-    ensure_dir(out_dir)
+async def export_3d(kicad, pcb_path: Path, out_dir: Path, make_glb: bool):
     step_out = out_dir / f"{pcb_path.stem}.step"
+    inputs = [pcb_path, *model_sources(pcb_path)]
+    cache = OutputCache(out_dir)
     # --subst-models reduces 3D issues; accept {0,2} and verify file
-    run([kicad, "pcb", "export", "step", "--subst-models", "-o", str(step_out), str(pcb_path)],
-        ok_codes={0, 2})
-    if not step_out.exists():
-        raise RuntimeError("STEP export did not produce a file.")
+    jobs = [run_if_stale(step_out, inputs,
+                         [kicad, "pcb", "export", "step", "--subst-models", "-o", str(step_out), str(pcb_path)],
+                         ok_codes={0, 2}, cache=cache)]
     if make_glb:
         glb_out = out_dir / f"{pcb_path.stem}.glb"
-        run([kicad, "pcb", "export", "glb", "--subst-models", "-o", str(glb_out), str(pcb_path)],
-            ok_codes={0, 2})
+        jobs.append(run_if_stale(glb_out, inputs,
+                                 [kicad, "pcb", "export", "glb", "--subst-models", "-o", str(glb_out), str(pcb_path)],
+                                 ok_codes={0, 2}, cache=cache))
+    try:
+        await asyncio.gather(*jobs)
+    finally:
+        cache.save()
+    if not step_out.exists():
+        raise RuntimeError("STEP export did not produce a file.")
     return step_out
 
-def export_pictures(kicad, pcb_path: Path, out_dir: Path, iso: bool):
-    ensure_dir(out_dir)
+async def export_pictures(kicad, pcb_path: Path, out_dir: Path, iso: bool):
     top = out_dir / f"{pcb_path.stem}_top.png"
     bot = out_dir / f"{pcb_path.stem}_bottom.png"
     side = out_dir / f"{pcb_path.stem}_side.png"
-
-    run([kicad, "pcb", "render", "-o", str(top), "--side", "top", "--background", "transparent", str(pcb_path)])
-    run([kicad, "pcb", "render", "-o", str(bot), "--side", "bottom", "--background", "transparent", str(pcb_path)])
-    # "side" = orthographic left view; change to 'right/front/back' if preferred
-    run([kicad, "pcb", "render", "-o", str(side), "--side", "left", "--background", "transparent", str(pcb_path)])
+    inputs = [pcb_path, *model_sources(pcb_path)]
+    cache = OutputCache(out_dir)
+
+    # One process per view: kicad-cli renders a single image per call, has no script
+    # mode, and pcbnew's Python API exposes no 3D renderer, so the board load can't be
+    # shared. The views run concurrently instead.
+    jobs = [
+        run_if_stale(top, inputs, [kicad, "pcb", "render", "-o", str(top), "--side", "top", "--background", "transparent", str(pcb_path)], cache=cache),
+        run_if_stale(bot, inputs, [kicad, "pcb", "render", "-o", str(bot), "--side", "bottom", "--background", "transparent", str(pcb_path)], cache=cache),
+        # "side" = orthographic left view; change to 'right/front/back' if preferred
+        run_if_stale(side, inputs, [kicad, "pcb", "render", "-o", str(side), "--side", "left", "--background", "transparent", str(pcb_path)], cache=cache),
+    ]
 
     iso_out = None
     if iso:
         iso_out = out_dir / f"{pcb_path.stem}_iso.png"
-        run([
+        jobs.append(run_if_stale(iso_out, inputs, [
             kicad, "pcb", "render", "-o", str(iso_out),
             "--background", "transparent", "--perspective",
             "--rotate", "'-45,0,45'", "--zoom", "1", str(pcb_path)
-        ])
+        ], cache=cache))
+    try:
+        await asyncio.gather(*jobs)
+    finally:
+        cache.save()
     return [top, bot, side] + ([iso_out] if iso_out else [])
 
-def export_docs(kicad, sch_path: Path, pcb_path: Path, out_dir: Path, include_drc: bool):
-    ensure_dir(out_dir)
+async def export_docs(kicad, sch_path: Path, pcb_path: Path, out_dir: Path, include_drc: bool):
+    """
+    Docs are skipped when their sources hash the same as last time (see OutputCache).
+    The schematic side covers every sheet next to the root sheet; both sides include
+    the project/rules files that drive ERC/DRC, plus the kicad-cli version.
+    """
+    cache = OutputCache(out_dir)
+    version = await kicad_version(kicad)
+    project = sch_path.with_suffix(".kicad_pro")
+    sch_inputs = schematic_sources(sch_path) + [project]
+    pcb_inputs = [pcb_path, project, pcb_path.with_suffix(".kicad_dru")]
+    sch_stamp = {"kicad": version, **{p.name: file_hash(p) for p in sch_inputs if p.exists()}}
+    pcb_stamp = {"kicad": version, **{p.name: file_hash(p) for p in pcb_inputs if p.exists()}}
+
     # Schematic PDF
     sch_pdf = out_dir / f"{sch_path.stem}_schematic.pdf"
-    run([kicad, "sch", "export", "pdf", "-o", str(sch_pdf), str(sch_path)])
+    jobs = [run_cached(cache, sch_pdf, sch_stamp, [kicad, "sch", "export", "pdf", "-o", str(sch_pdf), str(sch_path)])]
 
     # ERC report
     erc_rpt = out_dir / f"{sch_path.stem}_erc.rpt"
-    run([kicad, "sch", "erc", "-o", str(erc_rpt), str(sch_path)])
+    jobs.append(run_cached(cache, erc_rpt, sch_stamp, [kicad, "sch", "erc", "-o", str(erc_rpt), str(sch_path)]))
 
     # Board prints PDF (multi-page: common layers)
     board_pdf = out_dir / f"{pcb_path.stem}_board_prints.pdf"
@@ -346,23 +779,29 @@ def export_docs(kicad, sch_path: Path, pcb_path: Path, out_dir: Path, include_dr
         "F.Cu","B.Cu","F.SilkS","B.SilkS",
         "F.Mask","B.Mask","Edge.Cuts","F.Fab","B.Fab","User.Drawings"
     ])
-    run([
+    jobs.append(run_cached(cache, board_pdf, pcb_stamp, [
         kicad, "pcb", "export", "pdf",
         "-o", str(board_pdf),
         "--layers", layers,
         "--mode-multipage",
         str(pcb_path)
-    ])
+    ]))
 
     # Optional DRC (report lives with docs so it’s easy to review)
     drc_rpt = None
     if include_drc:
         drc_rpt = out_dir / f"{pcb_path.stem}_drc.rpt"
-        run([kicad, "pcb", "drc", "-o", str(drc_rpt), "--format", "report", str(pcb_path)])
+        jobs.append(run_cached(cache, drc_rpt, pcb_stamp,
+                               [kicad, "pcb", "drc", "-o", str(drc_rpt), "--format", "report", str(pcb_path)]))
 
+    try:
+        await asyncio.gather(*jobs)
+    finally:
+        cache.save()
     return sch_pdf, erc_rpt, board_pdf, drc_rpt
 
-def export_fab(kicad, sch_path: Path, pcb_path: Path, out_dir: Path, zip_outputs: bool):
+async def export_fab(kicad, sch_path: Path, pcb_path: Path, out_dir: Path, zip_outputs: bool,
+                     zip_store: bool = False, zip_only: bool = False, worker: PcbnewWorker = None):
     """
     Fabrication outputs into `out_dir`, which is assumed to be clean if --no-timestamp was used.
     - Gerbers → out_dir/gerbers
@@ -370,51 +809,84 @@ def export_fab(kicad, sch_path: Path, pcb_path: Path, out_dir: Path, zip_outputs
     - POS/PNP → out_dir/<project>_pos.csv
     - BOM     → out_dir/<project>_bom.csv
     - ZIP     → out_dir/<project>_gerbers.zip (overwrites each run when requested)
+    Outputs newer than their board/schematic are kept (the gerber job file and the
+    drill file stand in for their folders), unless --force is given.
+    With `worker`, drill/POS come from the shared pcbnew process (gerbers stay on kicad-cli).
+    With `zip_only`, gerbers are plotted to scratch space (RAM-backed /dev/shm when
+    available), moved into the ZIP and deleted; no gerbers folder is written.
     """
-    root = ensure_dir(out_dir)
-    gerb_dir = ensure_dir(root / "gerbers")
+    root = out_dir
     drill_dir = ensure_dir(root / "drill")
+    sch_inputs = schematic_sources(sch_path)
+    # Stable zip name that overwrites each run
+    zip_path = root / f"{pcb_path.stem}_gerbers.zip"
+    if zip_only:
+        scratch = "/dev/shm" if os.path.isdir("/dev/shm") else None
+        gerb_dir = Path(tempfile.mkdtemp(prefix="kct_gerb_", dir=scratch))
+        gerb_marker = zip_path
+    else:
+        gerb_dir = ensure_dir(root / "gerbers")
+        gerb_marker = gerb_dir / f"{pcb_path.stem}-job.gbrjob"
 
     # Gerbers: use saved board plot params for repeatability
-    run([kicad, "pcb", "export", "gerbers", "-o", str(gerb_dir), "--board-plot-params", str(pcb_path)])
+    gerbers_job = asyncio.ensure_future(run_if_stale(
+        gerb_marker, [pcb_path],
+        [kicad, "pcb", "export", "gerbers", "-o", str(gerb_dir), "--board-plot-params", str(pcb_path)]))
 
     # Drill (Excellon) + map
-    run([kicad, "pcb", "export", "drill", "-o", str(drill_dir), "--format", "excellon", "--generate-map", str(pcb_path)])
+    jobs = [run_if_stale(drill_dir / f"{pcb_path.stem}.drl", [pcb_path], [kicad, "pcb", "export", "drill", "-o", str(drill_dir), "--format", "excellon", "--generate-map", str(pcb_path)],
+                         worker=worker, op="drill", op_args={"out_dir": str(drill_dir)})]
 
     # POS/PNP (CSV, both sides, mm)
     pos_csv = root / f"{pcb_path.stem}_pos.csv"
-    run([kicad, "pcb", "export", "pos", "-o", str(pos_csv), "--format", "csv", "--units", "mm", "--side", "both", str(pcb_path)])
+    jobs.append(run_if_stale(pos_csv, [pcb_path], [kicad, "pcb", "export", "pos", "-o", str(pos_csv), "--format", "csv", "--units", "mm", "--side", "both", str(pcb_path)],
+                             worker=worker, op="pos", op_args={"out": str(pos_csv)}))
 
     # BOM (CSV) – include common fields if present
     bom_csv = root / f"{sch_path.stem}_bom.csv"
     fields = "Reference,Value,Footprint,${QUANTITY},Manufacturer,MPN,Datasheet,${DNP}"
     labels = "Refs,Value,Footprint,Qty,Manufacturer,MPN,Datasheet,DNP"
-    run([
+    jobs.append(run_if_stale(bom_csv, sch_inputs, [
         kicad, "sch", "export", "bom", "-o", str(bom_csv),
         "--fields", fields, "--labels", labels, "--group-by", "Value,Footprint,MPN",
         str(sch_path)
-    ])
-
-    zip_path = None
-    if zip_outputs:
-        # Stable zip name that overwrites each run
-        zip_path = root / f"{pcb_path.stem}_gerbers.zip"
-        # If it exists from a prior run, remove first to avoid stale entries
-        try:
-            if zip_path.exists():
-                zip_path.unlink()
-        except Exception:
-            pass
-        zip_dir(gerb_dir, zip_path)
+    ]))
+    # Start the other fab outputs now so they keep running while the ZIP is built
+    jobs = [asyncio.ensure_future(j) for j in jobs]
 
-    return gerb_dir, drill_dir, pos_csv, bom_csv, zip_path
+    try:
+        if zip_outputs:
+            # The ZIP only needs the gerbers
+            await gerbers_job
+            gerbers = [Path(path) for _, path, _ in _scan_files(gerb_dir)]
+            if zip_only and not gerbers:
+                # The ZIP is the plot's marker and was fresh; the skip is already reported
+                pass
+            elif not FORCE and up_to_date(zip_path, *gerbers):
+                print(f"== {zip_path.name} is up to date, skipping")
+            else:
+                # If it exists from a prior run, remove first to avoid stale entries
+                try:
+                    if zip_path.exists():
+                        zip_path.unlink()
+                except Exception:
+                    pass
+                await asyncio.to_thread(zip_dir, gerb_dir, zip_path, zip_store, zip_only)
+
+        await asyncio.gather(gerbers_job, *jobs)
+    finally:
+        if zip_only:
+            shutil.rmtree(gerb_dir, ignore_errors=True)
+    if not zip_outputs:
+        zip_path = None
+    return (None if zip_only else gerb_dir), drill_dir, pos_csv, bom_csv, zip_path
 
 
 def _sanitize_vendor(v: str) -> str:
     # lower, replace spaces/odd chars with '-', keep alnum/._-
     return re.sub(r'[^A-Za-z0-9_.-]+', '-', v.strip().lower())
 
-def run_kikit_fab(vendor: str, pcb_path: Path, sch_path: Path, out_dir: Path,
+async def run_kikit_fab(vendor: str, pcb_path: Path, sch_path: Path, out_dir: Path,
                   order_field: str = None, clean: bool = True):
     """
     Use KiKit to make a vendor-ready ZIP in a subfolder: <out_dir>/<vendor>_production
@@ -447,29 +919,45 @@ def run_kikit_fab(vendor: str, pcb_path: Path, sch_path: Path, out_dir: Path,
         cmd += ["--field", order_field]
     cmd += [str(pcb_path), str(vendor_root)]
 
-    run(cmd)
+    await run(cmd)
     return vendor_root / "gerbers.zip"
 # ---------- Main ----------
 
-def main():
+async def main():
+    # Taken once, at start-up, so everything in this run is labeled with the same time
+    tag = timestamp_tag()
     parser = argparse.ArgumentParser(description="Standardize KiCad 9 outputs into your folder structure.")
     parser.add_argument("--project", required=True, help="Path to .kicad_pro (or base path) of the project.")
     parser.add_argument("--root", default=".", help="Repo root containing 3D_MODEL, PICTURES, DOCUMENTATION, PRODUCTION.")
     parser.add_argument("--prod-dir", default="PRODUCTION", help="Production folder relative to root (default: PRODUCTION).")
     parser.add_argument("--iso", action="store_true", help="Also render an isometric image.")
     parser.add_argument("--glb", action="store_true", help="Also export .glb 3D model.")
-    parser.add_argument("--zip", action="store_true", help="Zip gerbers into <proj>_gerbers_<timestamp>.zip.")
+    parser.add_argument("--zip", action="store_true", help="Zip gerbers into <proj>_gerbers.zip in the production folder.")
+    parser.add_argument("--zip-store", action="store_true",
+                        help="Like --zip, but store gerbers uncompressed (fastest; accepted by fab houses).")
+    parser.add_argument("--zip-only", action="store_true",
+                        help="Like --zip, but don't keep a gerbers/ folder: gerbers go straight into the ZIP.")
     parser.add_argument("--kikit", default=None, help="Optional: vendor for KiKit 'fab' (e.g., 'jlcpcb').")
     parser.add_argument("--skip-drc", action="store_true", help="Skip DRC report.")
     parser.add_argument("--no-timestamp",action="store_true",
                         help="Write to PRODUCTION/<project> (cleared each run) instead of timestamped folders."
     )
+    parser.add_argument("--pcbnew-worker", action="store_true",
+                        help="Export drill/POS from one persistent KiCad Python process "
+                             "(falls back to kicad-cli per export if that fails).")
+    parser.add_argument("--force", action="store_true",
+                        help="Re-export everything, even outputs that are newer than their sources.")
+    parser.add_argument("--verbose", action="store_true",
+                        help="Echo each kicad-cli/KiKit command and show its progress output.")
     args = parser.parse_args()
 
-    kicad = which_kicad_cli()
-    proj_stem, sch_path, pcb_path = project_paths(Path(args.project))
+    global VERBOSE, FORCE
+    VERBOSE = args.verbose
+    FORCE = args.force
 
     root = Path(args.root).resolve()
+    kicad, proj_stem, sch_path, pcb_path = resolve_project(Path(args.project), root)
+
     three_d_dir = ensure_dir(root / "3D_MODEL")
     pics_dir = ensure_dir(root / "PICTURES")
     docs_dir = ensure_dir(root / "DOCUMENTATION")
@@ -481,30 +969,41 @@ def main():
         clear_dir(prod_root)  # destructive inside this folder (by design)
     else:
         # Keep old behavior: timestamped per run
-        prod_root = ensure_dir(root / args.prod_dir / f"{timestamp_tag()}_{proj_stem}")
+        prod_root = ensure_dir(root / args.prod_dir / f"{tag}_{proj_stem}")
 
     print(f"Project: {proj_stem}")
     print(f"SCH:     {sch_path}")
     print(f"PCB:     {pcb_path}")
     print(f"Root:    {root}")
 
-    # 1) 3D model(s)
-    export_3d(kicad, pcb_path, three_d_dir, args.glb)
-
-    # 2) Renders
-    export_pictures(kicad, pcb_path, pics_dir, args.iso)
-
-    # 3) Documentation (schematic PDF, ERC, board prints PDF [+ optional DRC])
-    export_docs(kicad, sch_path, pcb_path, docs_dir, include_drc=not args.skip_drc)
-
-    # 4) Fabrication (Gerbers, drill, PNP, BOM [+ ZIP])
-    export_fab(kicad, sch_path, pcb_path, prod_root, zip_outputs=args.zip)
-
-    # 5) Optional vendor-specific fab package via KiKit (e.g., jlcpcb)
-    if args.kikit:
-        print(f"Running KiKit fab for vendor: {args.kikit}")
-        vendor_zip = run_kikit_fab(args.kikit, pcb_path, sch_path, prod_root)
-        print(f"KiKit vendor ZIP: {vendor_zip}")
+    # All steps run concurrently; `run` caps the number of live kicad-cli processes.
+    steps = asyncio.gather(
+        # 1) 3D model(s)
+        export_3d(kicad, pcb_path, three_d_dir, args.glb),
+        # 2) Renders
+        export_pictures(kicad, pcb_path, pics_dir, args.iso),
+        # 3) Documentation (schematic PDF, ERC, board prints PDF [+ optional DRC])
+        export_docs(kicad, sch_path, pcb_path, docs_dir, include_drc=not args.skip_drc),
+    )
+    # 4) Fabrication (Gerbers, drill, PNP, BOM [+ ZIP]); the worker loads while 1-3 run
+    worker = await PcbnewWorker.start(kicad, pcb_path) if args.pcbnew_worker else None
+    try:
+        fab = asyncio.ensure_future(export_fab(kicad, sch_path, pcb_path, prod_root,
+                                                zip_outputs=args.zip or args.zip_store or args.zip_only,
+                                                zip_store=args.zip_store, zip_only=args.zip_only,
+                                                worker=worker))
+
+        # 5) Optional vendor-specific fab package via KiKit (e.g., jlcpcb), once fab outputs exist
+        if args.kikit:
+            await fab
+            print(f"Running KiKit fab for vendor: {args.kikit}")
+            vendor_zip = await run_kikit_fab(args.kikit, pcb_path, sch_path, prod_root)
+            print(f"KiKit vendor ZIP: {vendor_zip}")
+
+        await asyncio.gather(steps, fab)
+    finally:
+        if worker:
+            await worker.close()
 
     render_readme_if_missing(root, proj_stem)
     
@@ -517,7 +1016,7 @@ def main():
 
 if __name__ == "__main__":
     try:
-        main()
+        asyncio.run(main())
     except Exception as e:
         print(f"\nERROR: {e}", file=sys.stderr)
         sys.exit(1)